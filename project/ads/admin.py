@@ -8,6 +8,7 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ('name', 'id')
     list_display_links = ('name',)
     search_fields = ('name',)
+    readonly_fields = ('num_ads',)
 
 
 @admin.register(Ad)
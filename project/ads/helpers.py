@@ -1,4 +1,4 @@
-"""csv and json modules for read files"""
+"""Helpers of the ads app: csv to json conversion and model validation"""
 import csv
 import json
 
@@ -12,3 +12,11 @@ def convert_csv_to_json(csv_file, json_file) -> None:
 
     with open(json_file, 'w', encoding='utf-8') as file:
         json.dump(rows, file, ensure_ascii=False)
+
+
+def clean_touched_fields(instance, touched) -> None:
+    """Validate only the changed fields of the model instance
+    """
+    exclude = [field.name for field in instance._meta.fields if field.name not in touched]
+    instance.clean_fields(exclude=exclude)
+    instance.validate_unique(exclude=exclude)
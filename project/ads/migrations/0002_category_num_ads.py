@@ -0,0 +1,30 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_num_ads(apps, schema_editor):
+    Ad = apps.get_model('ads', 'Ad')
+    Category = apps.get_model('ads', 'Category')
+
+    ads_number = (Ad.objects.filter(category=OuterRef('pk'))
+                  .values('category')
+                  .annotate(total=Count('pk'))
+                  .values('total'))
+    Category.objects.update(num_ads=Coalesce(Subquery(ads_number), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0001_squashed_0002_alter_ad_image_alter_category_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='num_ads',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество объявлений'),
+        ),
+        migrations.RunPython(fill_num_ads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('ads', '0002_category_num_ads'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Selection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('items', models.ManyToManyField(to='ads.ad')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.user',
+                                            verbose_name='Владелец')),
+            ],
+            options={
+                'verbose_name': 'Подборка',
+                'verbose_name_plural': 'Подборки',
+            },
+        ),
+    ]
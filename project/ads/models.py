@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 
 from users.models import User
 
@@ -7,6 +7,8 @@ class Category(models.Model):
     name = models.CharField(max_length=20,
                             verbose_name='Категория',
                             unique=True)
+    num_ads = models.PositiveIntegerField(default=0,
+                                          verbose_name='Количество объявлений')
 
     def __str__(self):
         return f'{self.name}'
@@ -37,6 +39,11 @@ class Ad(models.Model):
     def __str__(self):
         return f'{self.name}'
 
+    def save(self, *args, **kwargs):
+        # The signals recount ads numbers of the categories in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     class Meta:
         ordering = ()
         verbose_name = 'Объявление'
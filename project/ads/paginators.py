@@ -0,0 +1,82 @@
+"""Paginators for large ads tables"""
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+
+class PkSlicePaginator(Paginator):
+    """Slice the primary keys first, then fetch only the rows of the page
+    """
+
+    @cached_property
+    def count(self):
+        return self.object_list.values('pk').count()
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        return self.slice_page(number, bottom, top)
+
+    def slice_page(self, number, bottom, top):
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+
+        return self._get_page(self.object_list.filter(pk__in=pks), number, self)
+
+
+class LargeTablePaginator(PkSlicePaginator):
+    """Use the planner estimate from pg_class as count of a large unfiltered table
+
+    The estimate is only reported as count, pages are never clamped to it:
+    past the estimated end a page is still fetched and may be empty.
+    """
+    estimate_threshold = 100_000
+
+    @cached_property
+    def estimated_count(self):
+        if connection.vendor != 'postgresql' or self.object_list.query.where:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                           [connection.ops.quote_name(self.object_list.model._meta.db_table)])
+            row = cursor.fetchone()
+
+        # Small tables are cheap to count and their stats are often stale
+        if not row or row[0] < self.estimate_threshold:
+            return None
+
+        return row[0]
+
+    @cached_property
+    def count(self):
+        if self.estimated_count is None:
+            return super().count
+        return self.estimated_count
+
+    def validate_number(self, number):
+        if self.estimated_count is None:
+            return super().validate_number(number)
+
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page number is not an integer'))
+        if number < 1:
+            raise EmptyPage(_('That page number is less than 1'))
+        return number
+
+    def page(self, number):
+        if self.estimated_count is None:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        return self.slice_page(number, bottom, bottom + self.per_page)
@@ -0,0 +1,12 @@
+"""orjson based responses for the ads views"""
+from django.http import HttpResponse
+from orjson import dumps, OPT_NON_STR_KEYS
+
+
+class OrjsonResponse(HttpResponse):
+    """Serialize data with orjson straight to bytes
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(dumps(data, option=OPT_NON_STR_KEYS), **kwargs)
@@ -0,0 +1,84 @@
+"""Signal handlers of the ads app"""
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from ads.models import Ad, Category
+
+CATEGORIES_VERSION_KEY = 'cats:ver'
+
+logger = logging.getLogger(__name__)
+
+
+def categories_cache_key() -> str:
+    """Key of the cached category list for the current version
+    """
+    return f'cats:v{cache.get(CATEGORIES_VERSION_KEY, 0)}'
+
+
+def bump_categories_version() -> None:
+    """Invalidate the cached category list
+    """
+    try:
+        cache.add(CATEGORIES_VERSION_KEY, 0, timeout=None)
+        cache.incr(CATEGORIES_VERSION_KEY)
+    # The cached list expires by itself, a committed write must not fail
+    except Exception:  # pylint: disable=broad-except
+        logger.exception('Could not invalidate the category list cache')
+
+
+def recount_num_ads(*category_ids) -> None:
+    """Recount the denormalized ads number of the categories from the ads table
+    """
+    ads_number = (Ad.objects.filter(category=OuterRef('pk'))
+                  .order_by()
+                  .values('category')
+                  .annotate(total=Count('pk'))
+                  .values('total'))
+    categories = Category.objects.filter(pk__in={pk for pk in category_ids if pk is not None})
+    # Concurrent writers of a category wait here, so the count below sees their ads
+    list(categories.select_for_update().order_by('pk').values_list('pk', flat=True))
+    categories.update(num_ads=Coalesce(Subquery(ads_number), 0))
+    transaction.on_commit(bump_categories_version)
+
+
+def _writes_category(update_fields) -> bool:
+    return update_fields is None or bool({'category', 'category_id'} & update_fields)
+
+
+@receiver(pre_save, sender=Ad)
+def lock_category(sender, instance, update_fields=None, **kwargs) -> None:
+    """Read the stored category of the ad under a row lock before it is moved
+    """
+    instance._category_id_in_db = None
+    if not instance._state.adding and _writes_category(update_fields):
+        # Ad.save() runs in a transaction, the lock is kept until the recount
+        instance._category_id_in_db = (Ad.objects.select_for_update()
+                                       .filter(pk=instance.pk)
+                                       .values_list('category_id', flat=True)
+                                       .first())
+
+
+@receiver(post_save, sender=Ad)
+def count_saved_ad(sender, instance, created, update_fields=None, **kwargs) -> None:
+    if created:
+        recount_num_ads(instance.category_id)
+    elif _writes_category(update_fields) and instance._category_id_in_db != instance.category_id:
+        recount_num_ads(instance._category_id_in_db, instance.category_id)
+
+
+@receiver(post_delete, sender=Ad)
+def count_deleted_ad(sender, instance, **kwargs) -> None:
+    recount_num_ads(instance.category_id)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_categories(sender, **kwargs) -> None:
+    """Invalidate the cached category list after a category change
+    """
+    transaction.on_commit(bump_categories_version)
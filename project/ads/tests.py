@@ -1,9 +1,13 @@
 import json
 from unittest import TestCase
 
+from django.test import TestCase as DatabaseTestCase
 import requests
 from faker import Faker
 
+from ads.models import Ad, Category
+from users.models import User
+
 HOST = 'http://127.0.0.1:8000'
 fake = Faker()
 
@@ -96,6 +100,24 @@ class AdClassTestCase(TestCase):
 
             return response.json().get('id')
 
+    def test_bulk_create(self):
+        post_data = [
+            {
+                "name": fake.job(),
+                "author_id": 3,
+                "category_id": 1,
+                "price": fake.random.randint(100, 10000),
+                "description": fake.paragraph(nb_sentences=1),
+                "is_published": True
+            }
+            for _ in range(3)
+        ]
+        response = requests.post(f'{HOST}/ad/create/', data=json.dumps(post_data), timeout=5)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), len(post_data))
+        print('Create ads with ids', response.json())
+
     def test_delete(self):
         ad_id = self.test_create()
         if ad_id:
@@ -118,3 +140,45 @@ class AdClassTestCase(TestCase):
                                      data=json.dumps(ad),
                                      timeout=15)
             self.assertEqual(response.status_code, 200)
+
+
+class CategoryNumAdsTestCase(DatabaseTestCase):
+
+    def setUp(self):
+        self.author = User.objects.create(username=fake.user_name(), first_name='Author',
+                                          last_name='Test', age=42)
+        self.first = Category.objects.create(name='First')
+        self.second = Category.objects.create(name='Second')
+
+    def assertNumAds(self, first, second):
+        self.assertEqual(Category.objects.get(pk=self.first.pk).num_ads, first)
+        self.assertEqual(Category.objects.get(pk=self.second.pk).num_ads, second)
+
+    def test_create_move_delete(self):
+        ad = Ad.objects.create(name='Ad', author=self.author, price=100, category=self.first)
+        Ad.objects.create(name='Other ad', author=self.author, price=200, category=self.first)
+        self.assertNumAds(2, 0)
+
+        ad.category = self.second
+        ad.save()
+        self.assertNumAds(1, 1)
+
+        # A deferred category_id is moved back as well
+        deferred = Ad.objects.only('name').get(pk=ad.pk)
+        deferred.category = self.first
+        deferred.save()
+        self.assertNumAds(2, 0)
+
+        # A stale copy moving the ad again starts from the stored category
+        stale = Ad.objects.get(pk=ad.pk)
+        ad.category = self.second
+        ad.save()
+        stale.category = self.second
+        stale.save()
+        self.assertNumAds(1, 1)
+
+        # Deleting the same ad twice does not count it twice
+        copy = Ad.objects.get(pk=ad.pk)
+        ad.delete()
+        copy.delete()
+        self.assertNumAds(1, 0)
@@ -1,9 +1,11 @@
 from django.urls import path
 
 from ads.views.ad import (
+    AdCreateView,
     AdUploadImageView
 )
 
 urlpatterns = [
+    path('create/', AdCreateView.as_view()),
     path('<int:pk>/upload_image/', AdUploadImageView.as_view())
 ]
@@ -1,7 +1,10 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
+import orjson
+
+_OK = orjson.dumps({
+    "status": "ok"
+})
 
 
 def index_route(request):
-    return JsonResponse({
-        "status": "ok"
-    })
+    return HttpResponse(_OK, content_type='application/json')
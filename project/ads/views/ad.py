@@ -1,61 +1,76 @@
-import json
+from operator import attrgetter
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
-from django.http import JsonResponse
+from django.db import transaction
+from django.db.models import F
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
+from django.utils.encoding import filepath_to_uri
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import DetailView, ListView, CreateView, DeleteView, UpdateView
+import orjson
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
 
-from ads.models import Ad
+from ads.helpers import clean_touched_fields
+from ads.models import Ad, Category
+from ads.paginators import LargeTablePaginator
 from ads.permissions import IsOwnerAdOrStaff
+from ads.responses import OrjsonResponse
 from ads.serializers import AdSerializer, AdDetailSerializer, AdListSerializer
+from ads.signals import recount_num_ads
 from users.models import User
 
+_MEDIA = settings.MEDIA_URL
+_AD_KEYS = ("id", "name", "author_id", "author", "price",
+            "description", "is_published", "category_id", "image")
+_AD_COLUMNS = ('id', 'name', 'author_id', 'author__first_name', 'price',
+               'description', 'is_published', 'category_id', 'image')
+# The author name is passed to _ad_to_dict by each view
+_AD_SERIALIZER = attrgetter('pk', 'name', 'author_id', 'price',
+                            'description', 'is_published', 'category_id')
+# ?fields=card shows ads without the description
+_AD_CARD_KEYS = tuple(key for key in _AD_KEYS if key != 'description')
+_AD_CARD_COLUMNS = tuple(column for column in _AD_COLUMNS if column != 'description')
+
+
+def _ad_to_dict(ad, author_name):
+    ad_id, name, author_id, *fields = _AD_SERIALIZER(ad)
+    image = ad.image.url if ad.image else None
+    return dict(zip(_AD_KEYS, (ad_id, name, author_id, author_name, *fields, image)))
+
 
 class AdListView(ListView):
     model = Ad
-    queryset = Ad.objects.select_related('author').order_by('-price')
+    # The author name is joined only by the query of the page rows
+    queryset = Ad.objects.order_by('-price')
 
     def get(self, request, *args, **kwargs):
         super().get(request, *args, **kwargs)
 
-        paginator = Paginator(self.object_list, settings.TOTAL_ON_PAGE)
-        page = int(request.GET.get('page', 0))
-        # IF ?page request param exist
-        if page:
-            obj = paginator.get_page(page)
-        else:
-            obj = self.object_list
-
-        items = []
-
-        for item in obj:
-            items.append(
-                {
-                    "id": item.pk,
-                    "name": item.name,
-                    "author_id": item.author_id,
-                    "author": item.author.first_name,
-                    "price": item.price,
-                    "description": item.description,
-                    "is_published": item.is_published,
-                    "category_id": item.category_id,
-                    "image": item.image.url if item.image else None
-                }
-            )
+        paginator = LargeTablePaginator(self.object_list, settings.TOTAL_ON_PAGE)
+        # Without ?page request param show the first page
+        obj = paginator.get_page(request.GET.get('page') or 1)
+
+        keys, columns = _AD_KEYS, _AD_COLUMNS
+        if request.GET.get('fields') == 'card':
+            keys, columns = _AD_CARD_KEYS, _AD_CARD_COLUMNS
+
+        # A page holds TOTAL_ON_PAGE rows, so it is fetched and serialized at once
+        items = [
+            dict(zip(keys, (*row, _MEDIA + filepath_to_uri(image) if image else None)))
+            for *row, image in obj.object_list.values_list(*columns)
+        ]
 
         response = {
             "items": items,
-            "total": self.object_list.count(),
+            "total": paginator.count,
             "num_pages": paginator.num_pages
         }
 
-        return JsonResponse(response, safe=False, json_dumps_params={"ensure_ascii": False})
+        return OrjsonResponse(response)
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -64,11 +79,19 @@ class AdCreateView(CreateView):
     fields = ['name', 'author', ]
 
     def post(self, request, *args, **kwargs):
-        ad_data = json.loads(request.body)
+        ad_data = orjson.loads(request.body)
+
+        # An array of ads is created in one batch
+        if isinstance(ad_data, list):
+            return self.bulk_create(ad_data)
 
         # User with admin role make to post ad
-        author = get_object_or_404(User, pk=ad_data['author_id'], role='admin')
-        category = get_object_or_404(Category, pk=ad_data.get('category_id'))
+        author = (User.objects.only('pk', 'first_name')
+                  .filter(pk=ad_data['author_id'], role='admin')
+                  .first())
+        category = Category.objects.only('pk').filter(pk=ad_data.get('category_id')).first()
+        if author is None or category is None:
+            raise Http404('No User or Category matches the given query.')
 
         ad = Ad(
             name=ad_data.get('name'),
@@ -76,52 +99,67 @@ class AdCreateView(CreateView):
             category=category,
             price=ad_data.get('price'),
             description=ad_data.get('description'),
-            is_published=bool(ad_data.get('is_bublished'))
+            is_published=bool(ad_data.get('is_published'))
         )
         ad.save()
 
-        return JsonResponse({
-            "id": ad.pk,
-            "name": ad.name,
-            "author_id": ad.author_id,
-            "author": ad.author.first_name,
-            "price": ad.price,
-            "description": ad.description,
-            "is_published": ad.is_published,
-            "category_id": ad.category_id,
-            "image": ad.image.url if ad.image else None
-        })
+        return OrjsonResponse(_ad_to_dict(ad, author.first_name))
+
+    def bulk_create(self, ads_data):
+        try:
+            author_ids = [int(item['author_id']) for item in ads_data]
+            category_ids = [int(item['category_id']) for item in ads_data]
+        except (KeyError, TypeError, ValueError):
+            return OrjsonResponse({"ads": ["author_id and category_id must be integers"]},
+                                  status=422)
+
+        # Authors and categories of the whole batch are fetched at once
+        authors = User.objects.only('pk').filter(role='admin').in_bulk(set(author_ids))
+        categories = Category.objects.only('pk').in_bulk(set(category_ids))
+        if not set(author_ids) <= authors.keys() or not set(category_ids) <= categories.keys():
+            raise Http404('No User or Category matches the given query.')
+
+        with transaction.atomic():
+            ads = Ad.objects.bulk_create(
+                [
+                    Ad(
+                        name=item.get('name'),
+                        author=authors[author_id],
+                        category=categories[category_id],
+                        price=item.get('price'),
+                        description=item.get('description'),
+                        is_published=bool(item.get('is_published'))
+                    )
+                    for item, author_id, category_id in zip(ads_data, author_ids, category_ids)
+                ],
+                batch_size=500
+            )
+            # bulk_create() does not send post_save
+            recount_num_ads(*set(category_ids))
+
+        return OrjsonResponse([ad.pk for ad in ads])
 
 
 class AdDetailView(DetailView):
     model = Ad
-    queryset = Ad.objects.select_related('author')
+    queryset = Ad.objects.annotate(author_first_name=F('author__first_name'))
 
     def get(self, request, *args, **kwargs):
         ad = self.get_object()
 
-        return JsonResponse({
-            "id": ad.pk,
-            "name": ad.name,
-            "author_id": ad.author_id,
-            "author": ad.author.first_name,
-            "price": ad.price,
-            "description": ad.description,
-            "is_published": ad.is_published,
-            "category_id": ad.category_id,
-            "image": ad.image.url if ad.image else None
-        })
+        return OrjsonResponse(_ad_to_dict(ad, ad.author_first_name))
 
 
 @method_decorator(csrf_exempt, name="dispatch")
 class AdDeleteView(DeleteView):
     model = Ad
+    queryset = Ad.objects.select_related('author', 'category')
     success_url = '/'
 
     def delete(self, request, *args, **kwargs):
         super().delete(request, *args, **kwargs)
 
-        return JsonResponse(
+        return OrjsonResponse(
             {
                 "status": "ok"
             }
@@ -131,13 +169,14 @@ class AdDeleteView(DeleteView):
 @method_decorator(csrf_exempt, name="dispatch")
 class AdUpdateView(UpdateView):
     model = Ad
+    queryset = Ad.objects.select_related('author', 'category')
     fields = ['name', 'author', 'price', 'description', 'category']
     success_url = '/'
 
     def post(self, request, *args, **kwargs):
-        super().post(request, *args, **kwargs)
+        self.object = self.get_object()
 
-        ad_data = json.loads(request.body)
+        ad_data = orjson.loads(request.body)
 
         # Only a user with the moderator status can update Ad
         author = get_object_or_404(User,
@@ -145,66 +184,53 @@ class AdUpdateView(UpdateView):
                                    pk=ad_data.get('author_id'))
         category = get_object_or_404(Category, pk=ad_data.get('category_id'))
 
+        touched = []
         if 'name' in ad_data:
             self.object.name = ad_data['name']
+            touched.append('name')
         if 'author' in ad_data:
             self.object.author = author
+            touched.append('author')
         if 'price' in ad_data:
             self.object.price = ad_data['price']
+            touched.append('price')
         if 'description' in ad_data:
             self.object.description = ad_data['description']
+            touched.append('description')
         if 'category' in ad_data:
             self.object.category = category
+            touched.append('category')
 
         try:
-            self.object.full_clean()
+            clean_touched_fields(self.object, touched)
         except ValidationError as e:
-            return JsonResponse(e.message_dict, status=422)
+            return OrjsonResponse(e.message_dict, status=422)
 
-        self.object.save()
+        self.object.save(update_fields=touched)
 
-        return JsonResponse({
-            "id": self.object.pk,
-            "name": self.object.name,
-            "author_id": self.object.author_id,
-            "author": self.object.author.first_name,
-            "price": self.object.price,
-            "description": self.object.description,
-            "is_published": self.object.is_published,
-            "category_id": self.object.category_id,
-            "image": self.object.image.url if self.object.image else None
-        })
+        return OrjsonResponse(_ad_to_dict(self.object, self.object.author.first_name))
 
 
 @method_decorator(csrf_exempt, name="dispatch")
 class AdUploadImageView(UpdateView):
     model = Ad
+    queryset = Ad.objects.select_related('author')
     fields = ['image']
     success_url = '/'
 
     def post(self, request, *args, **kwargs):
-        super().post(request, *args, **kwargs)
+        self.object = self.get_object()
 
         self.object.image = request.FILES['image']
 
         try:
-            self.object.full_clean()
+            clean_touched_fields(self.object, ['image'])
         except ValidationError as e:
-            return JsonResponse(e.message_dict, status=422)
-
-        self.object.save()
-
-        return JsonResponse({
-            "id": self.object.pk,
-            "name": self.object.name,
-            "author_id": self.object.author_id,
-            "author": self.object.author.first_name,
-            "price": self.object.price,
-            "description": self.object.description,
-            "is_published": self.object.is_published,
-            "category_id": self.object.category_id,
-            "image": self.object.image.url if self.object.image else None
-        })
+            return OrjsonResponse(e.message_dict, status=422)
+
+        self.object.save(update_fields=['image'])
+
+        return OrjsonResponse(_ad_to_dict(self.object, self.object.author.first_name))
 
 
 class AdViewSet(ModelViewSet):
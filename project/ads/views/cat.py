@@ -1,21 +1,37 @@
-import json
+import logging
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db.models import Count
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import DetailView, ListView, CreateView, DeleteView, UpdateView
+import orjson
 
+from ads.helpers import clean_touched_fields
 from ads.models import Category
+from ads.responses import OrjsonResponse
+from ads.signals import categories_cache_key
+
+logger = logging.getLogger(__name__)
 
 
 @method_decorator(csrf_exempt, name='dispatch')
 class CategoryListView(ListView):
     model = Category
-    queryset = Category.objects.annotate(num_ads=Count('ad')).order_by('name')
+    queryset = Category.objects.only('id', 'name', 'num_ads').order_by('name')
 
     def get(self, request, *args, **kwargs):
+        # Without the cache the list is read from the database
+        try:
+            key = categories_cache_key()
+            cached = cache.get(key)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Could not read the category list cache')
+            key = cached = None
+        if cached is not None:
+            return HttpResponse(cached, content_type='application/json')
+
         categories = self.get_queryset()
 
         response = []
@@ -26,7 +42,14 @@ class CategoryListView(ListView):
                 "ads_number": category.num_ads
             })
 
-        return JsonResponse(response, safe=False, json_dumps_params={"ensure_ascii": False})
+        content = orjson.dumps(response)
+        if key is not None:
+            try:
+                cache.set(key, content)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Could not write the category list cache')
+
+        return HttpResponse(content, content_type='application/json')
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -34,12 +57,12 @@ class CategoryCreateView(CreateView):
     model = Category
 
     def post(self, request, *args, **kwargs):
-        category_data = json.loads(request.body)
+        category_data = orjson.loads(request.body)
 
         category = Category(name=category_data.get('name'))
         category.save()
 
-        return JsonResponse({
+        return OrjsonResponse({
             "id": category.pk,
             "name": category.name
         })
@@ -51,7 +74,7 @@ class CategoryDetailView(DetailView):
     def get(self, request, *args, **kwargs):
         category = self.get_object()
 
-        return JsonResponse({
+        return OrjsonResponse({
             "id": category.id,
             "name": category.name,
         })
@@ -65,7 +88,7 @@ class CategoryDeleteView(DeleteView):
     def delete(self, request, *args, **kwargs):
         super().delete(request, *args, **kwargs)
 
-        return JsonResponse(
+        return OrjsonResponse(
             {
                 "status": "ok"
             }
@@ -79,20 +102,20 @@ class CategoryUpdateView(UpdateView):
     success_url = '/'
 
     def post(self, request, *args, **kwargs):
-        super().post(request, *args, **kwargs)
+        self.object = self.get_object()
 
-        category_data = json.loads(request.body)
+        category_data = orjson.loads(request.body)
 
         self.object.name = category_data['name']
 
         try:
-            self.object.full_clean()
+            clean_touched_fields(self.object, ['name'])
         except ValidationError as e:
-            return JsonResponse(e.message_dict, status=422)
+            return OrjsonResponse(e.message_dict, status=422)
 
-        self.object.save()
+        self.object.save(update_fields=['name'])
 
-        return JsonResponse(
+        return OrjsonResponse(
             {
                 "id": self.object.pk,
                 "name": self.object.name